@@ -1,14 +1,31 @@
 """Streamlit dashboard presenting hospital insights."""
 from __future__ import annotations
 
-import json
+import sys
+from datetime import date
 from pathlib import Path
 
+import joblib
+import numpy as np
+import orjson
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-DATA_DIR = Path(__file__).resolve().parents[2] / "data" / "processed"
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    # `streamlit run` only puts the script directory on sys.path.
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.dashboard.downsample import lttb_indices  # noqa: E402
+from src.pipeline.models import score_patients  # noqa: E402
+from src.pipeline.preprocess import load_patient_dataset  # noqa: E402
+
+DATA_DIR = PROJECT_ROOT / "data" / "processed"
+MODEL_PATH = DATA_DIR / "models" / "readmission_model.joblib"
+WEBGL_POINT_THRESHOLD = 200
+MAX_TREND_POINTS = 500
+RANKED_COLUMNS = ["patient_id", "department", "length_of_stay", "predicted_readmission_prob"]
 
 st.set_page_config(
     page_title="Central Hospital Insights",
@@ -17,44 +34,104 @@ st.set_page_config(
 )
 
 
-def _load_json(path: Path) -> dict | None:
+def _mtime(path: Path) -> float:
+    return path.stat().st_mtime if path.exists() else 0.0
+
+
+@st.cache_data
+def _load_json(path_str: str, mtime: float) -> dict | None:
+    path = Path(path_str)
     if path.exists():
-        return json.loads(path.read_text())
+        return orjson.loads(path.read_bytes())
     return None
 
 
 @st.cache_data
-def load_csv(name: str) -> pd.DataFrame | None:
-    path = DATA_DIR / name
+def _load_parquet(path_str: str, mtime: float) -> pd.DataFrame | None:
+    path = Path(path_str)
+    if path.exists():
+        return pd.read_parquet(path, engine="pyarrow")
+    return None
+
+
+# Bounded so models from earlier pipeline runs and frames for past
+# "Admitted since" picks are evicted instead of accumulating.
+@st.cache_resource(max_entries=2)
+def _load_model(path_str: str, mtime: float):
+    path = Path(path_str)
     if path.exists():
-        return pd.read_csv(path)
+        return joblib.load(path)
     return None
 
 
+@st.cache_resource(max_entries=8)
+def _score_ranked_patients(
+    patients_path: str,
+    patients_mtime: float,
+    model_path: str,
+    model_mtime: float,
+    since: date | None,
+) -> tuple[pd.DataFrame, np.ndarray] | None:
+    model = _load_model(model_path, model_mtime)
+    if not Path(patients_path).exists() or model is None:
+        return None
+    patients = load_patient_dataset(patients_path, since=since)
+    ranked = (
+        score_patients(model, patients)[RANKED_COLUMNS]
+        .sort_values("predicted_readmission_prob", ascending=False, ignore_index=True)
+    )
+    ascending_probs = np.ascontiguousarray(ranked["predicted_readmission_prob"].to_numpy()[::-1])
+    ascending_probs.flags.writeable = False
+    return ranked, ascending_probs
+
+
+def load_json(name: str) -> dict | None:
+    path = DATA_DIR / name
+    return _load_json(str(path), _mtime(path))
+
+
+def load_parquet(name: str) -> pd.DataFrame | None:
+    path = DATA_DIR / name
+    return _load_parquet(str(path), _mtime(path))
+
+
+def load_ranked_predictions(
+    since: date | None = None,
+) -> tuple[pd.DataFrame, np.ndarray] | None:
+    """Score processed patients with the saved model, ranked by descending risk.
+
+    Also returns the probabilities as an ascending array for threshold lookups.
+    Both are held in ``st.cache_resource`` and shared read-only across reruns, so a
+    slider change costs a ``searchsorted`` and a slice, not an unpickled copy.
+    Only week partitions on or after ``since`` are read. Cache keys are file mtimes,
+    so a pipeline refresh rescores without hashing frames. The pipeline swaps the
+    patient dataset directory in only once it is fully written, so its mtime never
+    keys a partial dataset.
+    """
+
+    patients_path = DATA_DIR / "processed_patients"
+    return _score_ranked_patients(
+        str(patients_path), _mtime(patients_path), str(MODEL_PATH), _mtime(MODEL_PATH), since
+    )
+
+
 def display_kpis(kpis: dict[str, float]) -> None:
-    st.markdown("""
-    <div style='display:flex; gap:1rem;'>
-      <div style='flex:1; padding:1rem; background:#f4f7fb; border-radius:12px;'>
-        <h4 style='margin:0; color: black'>Occupancy</h4>
-        <p style='font-size:32px; margin:0; font-weight:600; color: black'>{:.1f}%</p>
-        <small style='color: black'>Inpatient share of visits</small>
-      </div>
-      <div style='flex:1; padding:1rem; background:#fff1f0; border-radius:12px;'>
-        <h4 style='margin:0; color: black'>ICU Rate</h4>
-        <p style='font-size:32px; margin:0; font-weight:600; color: black'>{:.1f}%</p>
-        <small style='color: black'>Patients under critical care</small>
-      </div>
-      <div style='flex:1; padding:1rem; background:#f0fcf5; border-radius:12px;'>
-        <h4 style='margin:0; color: black'>Avg Treatment Cost</h4>
-        <p style='font-size:32px; margin:0; font-weight:600; color: black'>${:,.0f}</p>
-        <small style='color: black'>Across admissions & OPD</small>
-      </div>
-    </div>
-    """.format(
-        kpis.get("occupancy_rate", 0) * 100,
-        kpis.get("icu_rate", 0) * 100,
-        kpis.get("avg_treatment_cost", 0),
-    ), unsafe_allow_html=True)
+    cols = st.columns(3)
+    cols[0].metric(
+        "Occupancy",
+        f"{kpis.get('occupancy_rate', 0) * 100:.1f}%",
+        help="Inpatient share of visits",
+    )
+    cols[1].metric(
+        "ICU Rate",
+        f"{kpis.get('icu_rate', 0) * 100:.1f}%",
+        help="Patients under critical care",
+    )
+    cols[2].metric(
+        "Avg Treatment Cost",
+        f"${kpis.get('avg_treatment_cost', 0):,.0f}",
+        help="Across admissions & OPD",
+    )
 
     cols = st.columns(3)
     cols[0].metric("Readmissions", f"{kpis.get('readmission_rate', 0):.2f}")
@@ -70,12 +147,13 @@ def display_model_metrics(metrics: dict[str, float] | None) -> None:
     cols[1].metric("Test Accuracy", f"{metrics.get('test_accuracy', 0):.3f}")
 
 
-def display_predictions(predictions: pd.DataFrame, threshold: float) -> None:
+def display_predictions(
+    predictions: pd.DataFrame, ascending_probs: np.ndarray, threshold: float
+) -> None:
     st.subheader("Patient Readmission Risk")
-    high_risk = (
-        predictions[predictions["predicted_readmission_prob"] >= threshold]
-        .sort_values("predicted_readmission_prob", ascending=False)
-    )
+    # predictions is ranked by descending risk, so the high-risk rows are a prefix.
+    num_high_risk = len(ascending_probs) - np.searchsorted(ascending_probs, threshold, side="left")
+    high_risk = predictions.iloc[:num_high_risk]
     if high_risk.empty:
         st.info("No patients exceed the selected risk threshold. Lower the slider to include more cases.")
         return
@@ -84,21 +162,42 @@ def display_predictions(predictions: pd.DataFrame, threshold: float) -> None:
     with left:
         st.markdown("**High-risk patient roster**")
         st.dataframe(
-            high_risk[
-                ["patient_id", "department", "length_of_stay", "predicted_readmission_prob"]
-            ].head(12)
+            high_risk.head(12)
             .style.format({"predicted_readmission_prob": "{:.2f}"})
         )
     with right:
+        st.plotly_chart(_risk_figure(high_risk), use_container_width=True)
+
+
+def _risk_figure(high_risk: pd.DataFrame):
+    labels = {"patient_id": "Patient", "predicted_readmission_prob": "Risk"}
+    if len(high_risk) > WEBGL_POINT_THRESHOLD:
+        # SVG rendering stalls on large selections; plot every patient as WebGL markers.
+        fig = px.scatter(
+            high_risk,
+            x="patient_id",
+            y="predicted_readmission_prob",
+            color="department",
+            title="Risk probability across flagged patients",
+            labels=labels,
+            render_mode="webgl",
+        )
+    else:
         fig = px.bar(
             high_risk.head(8),
             x="patient_id",
             y="predicted_readmission_prob",
             color="department",
             title="Risk probability per patient",
-            labels={"patient_id": "Patient", "predicted_readmission_prob": "Risk"},
+            labels=labels,
         )
-        st.plotly_chart(fig, use_container_width=True)
+    fig.update_layout(uirevision="risk")
+    return fig
+
+
+def _downsample_trend(trend_df: pd.DataFrame, column: str) -> pd.DataFrame:
+    idx = lttb_indices(trend_df[column].to_numpy(dtype=np.float64), MAX_TREND_POINTS)
+    return trend_df.iloc[idx]
 
 
 def display_trends(trend_df: pd.DataFrame) -> None:
@@ -106,7 +205,7 @@ def display_trends(trend_df: pd.DataFrame) -> None:
     left, right = st.columns(2)
     with left:
         fig = px.line(
-            trend_df,
+            _downsample_trend(trend_df, "admissions"),
             x="admission_week",
             y="admissions",
             markers=True,
@@ -115,7 +214,7 @@ def display_trends(trend_df: pd.DataFrame) -> None:
         st.plotly_chart(fig, use_container_width=True)
     with right:
         fig_cost = px.bar(
-            trend_df,
+            _downsample_trend(trend_df, "avg_treatment_cost"),
             x="admission_week",
             y="avg_treatment_cost",
             labels={"avg_treatment_cost": "Avg Cost"},
@@ -136,15 +235,14 @@ def main() -> None:
     </div>
     """, unsafe_allow_html=True)
 
-    kpi_summary = _load_json(DATA_DIR / "kpi_summary.json")
+    kpi_summary = load_json("kpi_summary.json")
     if not kpi_summary:
         st.warning("Run src.pipeline.run_pipeline to produce KPI summaries.")
         return
 
     display_kpis(kpi_summary)
 
-    predictions = load_csv("predictions.csv")
-    model_metrics = _load_json(DATA_DIR / "model_metrics.json")
+    model_metrics = load_json("model_metrics.json")
     display_model_metrics(model_metrics)
 
     threshold = st.sidebar.slider(
@@ -159,13 +257,25 @@ def main() -> None:
         "### Filters\nUse the slider to focus on the riskiest names. Refresh the pipeline if you need current data."
     )
 
-    if predictions is not None:
-        display_predictions(predictions, threshold)
+    weekly_trend = load_parquet("weekly_trend.parquet")
+    since = None
+    if weekly_trend is not None and not weekly_trend.empty:
+        weeks = pd.to_datetime(weekly_trend["admission_week"]).dt.date
+        since = st.sidebar.date_input(
+            "Admitted since",
+            value=weeks.min(),
+            min_value=weeks.min(),
+            max_value=weeks.max(),
+            help="Only patients admitted in weeks starting on or after this date are loaded and scored.",
+        )
+
+    ranked_predictions = load_ranked_predictions(since)
+    if ranked_predictions is not None:
+        display_predictions(*ranked_predictions, threshold)
     else:
-        st.warning("Predictions CSV is missing. Run src.pipeline.run_pipeline first.")
+        st.warning("Processed patients or readmission model is missing. Run src.pipeline.run_pipeline first.")
 
-    weekly_trend = load_csv("weekly_trend.csv")
-    department_summary = load_csv("department_summary.csv")
+    department_summary = load_parquet("department_summary.parquet")
 
     if weekly_trend is not None:
         display_trends(weekly_trend)
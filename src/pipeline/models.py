@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
 
 import pandas as pd
 from joblib import dump
@@ -25,17 +24,38 @@ NUMERIC_FEATURES = [
     "opd_visit",
 ]
 CATEGORICAL_FEATURES = ["department", "treatment_category", "admission_type", "gender"]
+DECISION_THRESHOLD = 0.5
 
 
-def _expand_categoricals(df: pd.DataFrame, categories: Iterable[str]) -> pd.DataFrame:
-    return pd.get_dummies(df, columns=list(categories), drop_first=True)
+def _build_feature_matrix(df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+    # Categorical dtype lets HistGradientBoosting bin categories natively, no one-hot expansion.
+    features = NUMERIC_FEATURES + CATEGORICAL_FEATURES
+    # Columns that are already categorical (e.g. department) are not re-factorized.
+    to_encode = {
+        cat: "category"
+        for cat in CATEGORICAL_FEATURES
+        if not isinstance(df[cat].dtype, pd.CategoricalDtype)
+    }
+    X = df[features].astype(to_encode) if to_encode else df[features]
+    return X, features
 
 
-def _build_feature_matrix(df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
-    expanded = _expand_categoricals(df, CATEGORICAL_FEATURES)
-    cat_columns = [c for c in expanded.columns if any(c.startswith(f"{cat}_") for cat in CATEGORICAL_FEATURES)]
-    features = NUMERIC_FEATURES + cat_columns
-    return expanded[features].fillna(0), features
+def _predict_readmission_proba(model: HistGradientBoostingClassifier, X: pd.DataFrame) -> pd.Series:
+    return pd.Series(model.predict_proba(X)[:, 1], index=X.index)
+
+
+def _attach_scores(df: pd.DataFrame, proba: pd.Series) -> pd.DataFrame:
+    df_scored = df.copy()
+    df_scored["predicted_readmission_prob"] = proba
+    df_scored["predicted_readmission_class"] = (proba >= DECISION_THRESHOLD).astype(int)
+    return df_scored
+
+
+def score_patients(model: HistGradientBoostingClassifier, df: pd.DataFrame) -> pd.DataFrame:
+    """Score processed patients with a fitted readmission model."""
+
+    X, _ = _build_feature_matrix(df)
+    return _attach_scores(df, _predict_readmission_proba(model, X))
 
 
 def train_readmission_model(
@@ -50,20 +70,26 @@ def train_readmission_model(
         X, y, test_size=0.25, random_state=42, stratify=y
     )
 
-    model = HistGradientBoostingClassifier(random_state=42)
+    model = HistGradientBoostingClassifier(
+        random_state=42,
+        categorical_features="from_dtype",
+        early_stopping=True,
+        n_iter_no_change=10,
+        validation_fraction=0.1,
+    )
     model.fit(X_train, y_train)
 
-    y_pred = model.predict(X_test)
-    y_proba = model.predict_proba(X_test)[:, 1]
+    # Score every row once; the held-out metrics reuse the same probabilities.
+    proba_full = _predict_readmission_proba(model, X)
+    y_proba = proba_full.loc[X_test.index]
+    y_pred = (y_proba >= DECISION_THRESHOLD).astype(int)
 
     metrics = {
         "roc_auc": round(roc_auc_score(y_test, y_proba), 3),
         "test_accuracy": round((y_test == y_pred).mean(), 3),
     }
 
-    df_scored = df.copy()
-    df_scored["predicted_readmission_prob"] = model.predict_proba(X)[:, 1]
-    df_scored["predicted_readmission_class"] = model.predict(X)
+    df_scored = _attach_scores(df, proba_full)
 
     model_output_path = Path(model_output_path)
     model_output_path.parent.mkdir(parents=True, exist_ok=True)
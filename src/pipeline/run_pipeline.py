@@ -1,35 +1,58 @@
 """Main entry point for data preparation, KPI computation, and modeling."""
 from __future__ import annotations
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+import pandas as pd
+
 from .data_generator import generate_patient_data
 from .models import train_readmission_model
-from .preprocess import load_raw_data, preprocess_patient_data
+from .preprocess import load_raw_data, preprocess_patient_data, write_patient_dataset
+
+
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+
+
+def _write_json(payload: dict[str, float], path: Path) -> None:
+    # KPI values are often NumPy scalars, which orjson only accepts with OPT_SERIALIZE_NUMPY.
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+
+def load_or_generate_raw_data(raw_dir: Path) -> pd.DataFrame:
+    """Load ``patient_events.parquet``, else an imported ``patient_events.csv``, else synthesize."""
+
+    for raw_file in (raw_dir / "patient_events.parquet", raw_dir / "patient_events.csv"):
+        if raw_file.exists():
+            return load_raw_data(raw_file)
+    return generate_patient_data(raw_dir / "patient_events.parquet", num_records=2500)
 
 
 def main() -> None:
     project_root = Path(__file__).resolve().parents[2]
-    raw_file = project_root / "data" / "raw" / "patient_events.csv"
     processed_dir = project_root / "data" / "processed"
     processed_dir.mkdir(parents=True, exist_ok=True)
 
-    if raw_file.exists():
-        raw_df = load_raw_data(raw_file)
-    else:
-        raw_df = generate_patient_data(raw_file, num_records=2500)
+    raw_df = load_or_generate_raw_data(project_root / "data" / "raw")
 
     processed_df, kpi_summary, department_summary, weekly_trend = preprocess_patient_data(raw_df)
-    processed_df.to_csv(processed_dir / "processed_patients.csv", index=False)
-    department_summary.to_csv(processed_dir / "department_summary.csv", index=False)
-    weekly_trend.to_csv(processed_dir / "weekly_trend.csv", index=False)
-    (processed_dir / "kpi_summary.json").write_text(json.dumps(kpi_summary, indent=2))
-
     model_output_path = processed_dir / "models" / "readmission_model.joblib"
-    scored_df, model_metrics = train_readmission_model(processed_df, model_output_path)
-    scored_df.to_csv(processed_dir / "predictions.csv", index=False)
-    (processed_dir / "model_metrics.json").write_text(json.dumps(model_metrics, indent=2))
+    # Training only reads processed_df, so the Parquet writes run behind it on worker threads.
+    with ThreadPoolExecutor() as executor:
+        pending_writes = [
+            executor.submit(write_patient_dataset, processed_df, processed_dir / "processed_patients"),
+            executor.submit(_write_parquet, department_summary, processed_dir / "department_summary.parquet"),
+            executor.submit(_write_parquet, weekly_trend, processed_dir / "weekly_trend.parquet"),
+        ]
+        _write_json(kpi_summary, processed_dir / "kpi_summary.json")
+        scored_df, model_metrics = train_readmission_model(processed_df, model_output_path)
+        for future in pending_writes:
+            future.result()
+
+    _write_parquet(scored_df, processed_dir / "predictions.parquet")
+    _write_json(model_metrics, processed_dir / "model_metrics.json")
 
     print("Pipeline complete. KPIs, predictions, and model saved to data/processed.")
 
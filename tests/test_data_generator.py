@@ -1,12 +1,32 @@
 from pathlib import Path
 
-from src.pipeline.data_generator import generate_patient_data
+import numpy as np
+import pandas as pd
 
+from src.pipeline.data_generator import DEPARTMENTS, _pick, generate_patient_data
 
-def test_data_generator_creates_csv(tmp_path: Path) -> None:
-    output = tmp_path / "patient_events.csv"
+
+def test_data_generator_creates_parquet(tmp_path: Path) -> None:
+    output = tmp_path / "patient_events.parquet"
     df = generate_patient_data(output, num_records=100)
 
     assert output.exists()
     assert not df.empty
     assert set(["patient_id", "admission_date", "department"]) <= set(df.columns)
+
+
+def test_pick_covers_options_with_expected_proportions() -> None:
+    rng = np.random.default_rng(0)
+    draws = rng.random(200_000)
+    # Include the extremes of [0, 1) to check the index stays in bounds.
+    draws[:2] = [0.0, np.nextafter(1.0, 0.0)]
+
+    uniform = pd.Series(_pick(DEPARTMENTS, draws)).value_counts(normalize=True)
+    weighted = pd.Series(_pick(["Male", "Female", "Other"], draws, p=[0.45, 0.45, 0.10])).value_counts(
+        normalize=True
+    )
+
+    assert set(uniform.index) == set(DEPARTMENTS)
+    assert np.allclose(uniform.to_numpy(), 1 / len(DEPARTMENTS), atol=0.01)
+    assert set(weighted.index) == {"Male", "Female", "Other"}
+    assert np.allclose(weighted[["Male", "Female", "Other"]].to_numpy(), [0.45, 0.45, 0.10], atol=0.01)
@@ -0,0 +1,22 @@
+import numpy as np
+
+from src.dashboard.downsample import lttb_indices
+
+
+def test_lttb_keeps_endpoints_peaks_and_order() -> None:
+    rng = np.random.default_rng(0)
+    for n in (501, 502, 777, 1000, 2500, 5000):
+        y = np.sin(np.linspace(0, 40, n)) + rng.normal(0, 0.1, n)
+        peak = n // 3
+        y[peak] = 25.0
+
+        idx = lttb_indices(y, 500)
+
+        assert len(idx) == 500
+        assert (np.diff(idx) > 0).all()
+        assert idx[0] == 0 and idx[-1] == n - 1
+        assert peak in idx
+
+
+def test_lttb_returns_all_points_when_short() -> None:
+    assert lttb_indices(np.arange(52, dtype=np.float64), 500).tolist() == list(range(52))
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+from joblib import load
+
+from src.pipeline.data_generator import generate_patient_data
+from src.pipeline.models import score_patients, train_readmission_model
+from src.pipeline.preprocess import preprocess_patient_data
+
+
+def test_score_patients_matches_training_scores(tmp_path: Path) -> None:
+    raw_df = generate_patient_data(tmp_path / "patient_events.parquet", num_records=200)
+    processed_df, _, _, _ = preprocess_patient_data(raw_df)
+    scored_df, metrics = train_readmission_model(processed_df, tmp_path / "model.joblib")
+
+    rescored_df = score_patients(load(tmp_path / "model.joblib"), processed_df)
+
+    assert "roc_auc" in metrics
+    assert (rescored_df["predicted_readmission_prob"] == scored_df["predicted_readmission_prob"]).all()
@@ -1,11 +1,20 @@
 from pathlib import Path
 
+import pandas as pd
+
 from src.pipeline.data_generator import generate_patient_data
-from src.pipeline.preprocess import load_raw_data, preprocess_patient_data
+from src.pipeline.models import train_readmission_model
+from src.pipeline.preprocess import (
+    _week_start,
+    load_patient_dataset,
+    load_raw_data,
+    preprocess_patient_data,
+    write_patient_dataset,
+)
 
 
 def test_preprocess_returns_kpi(tmp_path: Path) -> None:
-    raw_path = tmp_path / "patient_events.csv"
+    raw_path = tmp_path / "patient_events.parquet"
     generate_patient_data(raw_path, num_records=80)
     raw_df = load_raw_data(raw_path)
     processed_df, kpi_summary, dept_summary, weekly_trend = preprocess_patient_data(raw_df)
@@ -14,3 +23,78 @@ def test_preprocess_returns_kpi(tmp_path: Path) -> None:
     assert "occupancy_rate" in kpi_summary
     assert dept_summary.shape[0] > 0
     assert weekly_trend.shape[0] > 0
+
+
+def test_patient_dataset_reads_only_recent_weeks(tmp_path: Path) -> None:
+    raw_df = generate_patient_data(tmp_path / "patient_events.parquet", num_records=120)
+    processed_df, _, _, _ = preprocess_patient_data(raw_df)
+    dataset_dir = tmp_path / "processed_patients"
+    write_patient_dataset(processed_df, dataset_dir)
+
+    since = processed_df["admission_week"].median().date()
+    recent_df = load_patient_dataset(dataset_dir, since=since)
+
+    assert len(load_patient_dataset(dataset_dir)) == len(processed_df)
+    assert len(recent_df) == (processed_df["admission_week"].dt.date >= since).sum()
+
+
+def test_load_raw_data_reads_imported_csv(tmp_path: Path) -> None:
+    raw_df = generate_patient_data(tmp_path / "patient_events.parquet", num_records=80)
+    csv_path = tmp_path / "patient_events.csv"
+    raw_df.to_csv(csv_path, index=False)
+
+    imported_df = load_raw_data(csv_path)
+    processed_df, kpi_summary, _, weekly_trend = preprocess_patient_data(imported_df)
+    scored_df, _ = train_readmission_model(processed_df, tmp_path / "model.joblib")
+
+    assert len(imported_df) == len(raw_df)
+    assert kpi_summary["occupancy_rate"] == round(raw_df["admission_type"].eq("Inpatient").mean(), 3)
+    assert weekly_trend.shape[0] > 0
+    assert scored_df["predicted_readmission_prob"].between(0, 1).all()
+
+
+def test_patient_dataset_rewrite_replaces_previous_run(tmp_path: Path) -> None:
+    dataset_dir = tmp_path / "processed_patients"
+    first_df, _, _, _ = preprocess_patient_data(
+        generate_patient_data(tmp_path / "first.parquet", num_records=120, seed=1)
+    )
+    second_df, _, _, _ = preprocess_patient_data(
+        generate_patient_data(tmp_path / "second.parquet", num_records=20, seed=2)
+    )
+    write_patient_dataset(first_df, dataset_dir)
+    write_patient_dataset(second_df, dataset_dir)
+
+    reloaded_df = load_patient_dataset(dataset_dir)
+
+    assert sorted(reloaded_df["patient_id"]) == sorted(second_df["patient_id"])
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == ["processed_patients"]
+
+
+def test_patient_dataset_writes_more_than_1024_weeks(tmp_path: Path) -> None:
+    weeks = pd.date_range("2000-01-03", periods=1100, freq="7D")
+    df = pd.DataFrame({"patient_id": range(len(weeks)), "admission_week": weeks})
+    dataset_dir = tmp_path / "processed_patients"
+
+    write_patient_dataset(df, dataset_dir)
+
+    assert len(load_patient_dataset(dataset_dir)) == len(weeks)
+    assert len(load_patient_dataset(dataset_dir, since=weeks[-10].date())) == 10
+
+
+def test_week_start_matches_period_start_time() -> None:
+    dates = pd.Series(
+        pd.to_datetime(
+            [
+                "2025-03-03 00:00:00",
+                "2025-03-05 13:45:12",
+                "2025-03-09 23:59:59",
+                "2025-03-10 00:00:01",
+                "2024-12-31 08:30:00",
+                "2024-02-29 17:00:00",
+            ]
+        )
+    )
+
+    expected = dates.dt.to_period("W").dt.start_time
+
+    assert _week_start(dates).tolist() == expected.tolist()
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from src.pipeline.data_generator import generate_patient_data
+from src.pipeline.run_pipeline import load_or_generate_raw_data
+
+
+def test_pipeline_loads_imported_csv_instead_of_synthesizing(tmp_path: Path) -> None:
+    source_df = generate_patient_data(tmp_path / "source.parquet", num_records=50)
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    source_df.to_csv(raw_dir / "patient_events.csv", index=False)
+
+    raw_df = load_or_generate_raw_data(raw_dir)
+
+    assert len(raw_df) == 50
+    assert raw_df["patient_id"].tolist() == source_df["patient_id"].tolist()
+    assert not (raw_dir / "patient_events.parquet").exists()
+
+
+def test_pipeline_prefers_parquet_over_imported_csv(tmp_path: Path) -> None:
+    raw_dir = tmp_path / "raw"
+    generate_patient_data(raw_dir / "patient_events.parquet", num_records=30)
+    generate_patient_data(tmp_path / "other.parquet", num_records=60).to_csv(
+        raw_dir / "patient_events.csv", index=False
+    )
+
+    assert len(load_or_generate_raw_data(raw_dir)) == 30